@@ -30,6 +30,7 @@ setup(
         "console_scripts": [
             "ner-cli=src.cli:main",
             "ner-server=src.cli:server",
+            "ner-batch=src.cli:batch",
         ],
     },
     keywords="ner, nlp, spanish, named-entity-recognition, transformers, bert",
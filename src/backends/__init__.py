@@ -1,14 +1,27 @@
+import threading
 from .base import NERBackend
 from .spacy_backend import SpacyNERBackend
 
 __all__ = ['NERBackend', 'SpacyNERBackend']
 
+# Resolved MITIE backend class, imported on first use
+_mitie_cls = None
+_mitie_lock = threading.Lock()
+
 # Lazy import MITIE to avoid import errors if not installed
 def get_mitie_backend():
     """Lazy import MITIE backend to avoid import errors if not installed"""
+    global _mitie_cls
+    
+    if _mitie_cls is not None:
+        return _mitie_cls
+    
     try:
-        from .mitie_backend import MitieNERBackend
-        return MitieNERBackend
+        with _mitie_lock:
+            if _mitie_cls is None:
+                from .mitie_backend import MitieNERBackend
+                _mitie_cls = MitieNERBackend
+        return _mitie_cls
     except ImportError as e:
         raise ImportError(
             "MITIE backend not available. Install with:\n"
@@ -1,5 +1,48 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+import threading
+
+# Standard mapping from backend tags to our tag set - backends can override _normalize_tag
+_TAG_MAP = {
+    "PER": "PERSON",
+    "PERSON": "PERSON",
+    "LOC": "LOCATION",
+    "LOCATION": "LOCATION", 
+    "GPE": "LOCATION",
+    "ORG": "ORGANIZATION",
+    "ORGANIZATION": "ORGANIZATION",
+    "MISC": "MISC",
+    "NORP": "MISC",
+    "FACILITY": "PLACE",
+    "FAC": "PLACE",
+    "PLACE": "PLACE",
+    "EVENT": "MISC",
+    "WORK_OF_ART": "MISC",
+    "LAW": "MISC",
+    "LANGUAGE": "MISC",
+    "DATE": "MISC",
+    "TIME": "MISC",
+    "PERCENT": "MISC",
+    "MONEY": "MISC",
+    "QUANTITY": "MISC",
+    "ORDINAL": "MISC",
+    "CARDINAL": "MISC"
+}
+
+# IOB chunk prefixes some taggers put in front of entity labels
+_PREFIXES = ("B-", "I-")
+
+@lru_cache(maxsize=128)
+def _normalize_tag_cached(tag: str) -> str:
+    """Look up the standard tag for a backend tag, memoized per distinct tag"""
+    clean = tag[2:] if tag.startswith(_PREFIXES) else tag
+    
+    # Tags are usually already uppercase; only uppercase on a miss
+    normalized = _TAG_MAP.get(clean)
+    if normalized is None:
+        normalized = _TAG_MAP.get(clean.upper(), "MISC")
+    return normalized
 
 class NERBackend(ABC):
     """Abstract base class for Named Entity Recognition backends"""
@@ -14,12 +57,21 @@ class NERBackend(ABC):
         """
         self.model_name = model_name
         self.is_loaded = False
+        self._load_lock = threading.Lock()
     
     @abstractmethod
     def load_model(self) -> None:
         """Load the NER model"""
         pass
     
+    def ensure_loaded(self) -> None:
+        """Load the model on first use; models are not loaded at construction"""
+        if self.is_loaded:
+            return
+        with self._load_lock:
+            if not self.is_loaded:
+                self.load_model()
+    
     @abstractmethod
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -34,6 +86,30 @@ class NERBackend(ABC):
         """
         pass
     
+    def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract named entities from several texts
+        
+        Backends that can process documents together should override this;
+        the default simply calls extract_entities for each text.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            One list of entities per input text, in the same order
+        """
+        return [self.extract_entities(text) for text in texts]
+    
+    def availability_error(self) -> Optional[str]:
+        """
+        Cheaply check whether the model could be loaded, without loading it
+        
+        Returns:
+            None if the backend is available, otherwise the reason it is not
+        """
+        return None
+    
     @abstractmethod
     def get_backend_info(self) -> Dict[str, Any]:
         """
@@ -64,60 +140,26 @@ class NERBackend(ABC):
         Returns:
             Normalized tag from: PERSON, LOCATION, ORGANIZATION, MISC, PLACE
         """
-        # Standard mapping - can be overridden by backends
-        tag_mapping = {
-            "PER": "PERSON",
-            "PERSON": "PERSON",
-            "LOC": "LOCATION",
-            "LOCATION": "LOCATION", 
-            "GPE": "LOCATION",
-            "ORG": "ORGANIZATION",
-            "ORGANIZATION": "ORGANIZATION",
-            "MISC": "MISC",
-            "NORP": "MISC",
-            "FACILITY": "PLACE",
-            "FAC": "PLACE",
-            "PLACE": "PLACE",
-            "EVENT": "MISC",
-            "WORK_OF_ART": "MISC",
-            "LAW": "MISC",
-            "LANGUAGE": "MISC",
-            "DATE": "MISC",
-            "TIME": "MISC",
-            "PERCENT": "MISC",
-            "MONEY": "MISC",
-            "QUANTITY": "MISC",
-            "ORDINAL": "MISC",
-            "CARDINAL": "MISC"
-        }
-        
-        return tag_mapping.get(tag.upper(), "MISC")
+        return _normalize_tag_cached(tag)
     
-    def _ensure_unique_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _is_new_entity(seen_entities: set, label: str, tag: str) -> bool:
         """
-        Ensure entity uniqueness across the results
+        Record an entity and report whether it was not seen before
+        
+        Entities are unique by case-insensitive label and tag; backends call
+        this while extracting, with labels already stripped.
         
         Args:
-            entities: List of entities to deduplicate
+            seen_entities: Keys of the entities already kept for this text
+            label: Stripped entity label
+            tag: Normalized entity tag
             
         Returns:
-            List of unique entities
+            True if the entity is new and should be kept
         """
-        seen_entities = set()
-        unique_entities = []
-        
-        for entity in entities:
-            # Clean the entity text
-            clean_label = entity["label"].strip()
-            
-            # Create unique identifier (case-insensitive label + tag)
-            entity_key = (clean_label.lower(), entity["tag"])
-            
-            # Only add if we haven't seen this exact entity before
-            if entity_key not in seen_entities:
-                seen_entities.add(entity_key)
-                # Update the entity with clean label
-                entity["label"] = clean_label
-                unique_entities.append(entity)
-        
-        return unique_entities
\ No newline at end of file
+        entity_key = (label.lower(), tag)
+        if entity_key in seen_entities:
+            return False
+        seen_entities.add(entity_key)
+        return True
\ No newline at end of file
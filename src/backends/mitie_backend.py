@@ -1,10 +1,14 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import importlib.util
 import logging
 import os
 from .base import NERBackend
 
 logger = logging.getLogger(__name__)
 
+# Bound formatter for entity confidence scores (%-formatting is cheaper than str.format)
+_FMT_SCORE = "%.4f".__mod__
+
 class MitieNERBackend(NERBackend):
     """MITIE-based Named Entity Recognition backend"""
     
@@ -24,7 +28,7 @@ class MitieNERBackend(NERBackend):
         self.model_path = model_name
         self.ner = None
         self.mitie = None
-        self.load_model()
+        self._supported = frozenset(self.get_supported_entities())
     
     def load_model(self) -> None:
         """Load the MITIE NER model"""
@@ -33,7 +37,7 @@ class MitieNERBackend(NERBackend):
             import mitie
             self.mitie = mitie
             
-            logger.info(f"Loading MITIE model: {self.model_path}")
+            logger.info("Loading MITIE model: %s", self.model_path)
             
             # Check if model file exists
             if not os.path.exists(self.model_path):
@@ -56,7 +60,7 @@ class MitieNERBackend(NERBackend):
                 f"Original error: {e}"
             )
         except Exception as e:
-            logger.error(f"Error loading MITIE model: {e}")
+            logger.error("Error loading MITIE model: %s", e)
             raise RuntimeError(f"Could not load MITIE NER model: {e}")
     
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
@@ -70,18 +74,18 @@ class MitieNERBackend(NERBackend):
             List of unique entities with format:
             [{"tag": str, "score": str, "label": str}]
         """
-        if not self.is_loaded or not self.ner:
-            raise RuntimeError("MITIE NER model is not loaded")
-        
         if not text or not text.strip():
             return []
         
+        self.ensure_loaded()
+        
         try:
             # Tokenize text for MITIE
             tokens = self.mitie.tokenize(text)
             
-            # Extract entities
+            # Extract entities, dropping duplicates as we go
             entities = []
+            seen_entities = set()
             ner_results = self.ner.extract_entities(tokens)
             
             for entity in ner_results:
@@ -93,33 +97,38 @@ class MitieNERBackend(NERBackend):
                 elif len(entity) == 3:
                     entity_range, tag, score = entity
                 else:
-                    logger.warning(f"Unexpected MITIE entity format: {entity}")
+                    logger.warning("Unexpected MITIE entity format: %s", entity)
+                    continue
+                
+                # Normalize tag to our standard format
+                normalized_tag = self._normalize_mitie_tag(tag)
+                
+                # Filter only required tags and minimum score
+                if normalized_tag not in self._supported or score < 0.5:
                     continue
                 
                 # Extract entity text from tokens - entity_range is a range object
                 # Convert bytes to string if needed
                 token_slice = tokens[entity_range.start:entity_range.stop]
                 if token_slice and isinstance(token_slice[0], bytes):
-                    entity_text = " ".join(token.decode('utf-8') for token in token_slice)
+                    entity_text = b" ".join(token_slice).decode('utf-8')
                 else:
                     entity_text = " ".join(token_slice)
                 
-                # Normalize tag to our standard format
-                normalized_tag = self._normalize_mitie_tag(tag)
+                entity_text = entity_text.strip()
+                if not self._is_new_entity(seen_entities, entity_text, normalized_tag):
+                    continue
                 
-                # Filter only required tags and minimum score
-                if normalized_tag in self.get_supported_entities() and score >= 0.5:
-                    entities.append({
-                        "tag": normalized_tag,
-                        "score": f"{score:.4f}",  # MITIE provides actual confidence scores
-                        "label": entity_text
-                    })
+                entities.append({
+                    "tag": normalized_tag,
+                    "score": _FMT_SCORE(score),  # MITIE provides actual confidence scores
+                    "label": entity_text
+                })
             
-            # Ensure uniqueness
-            return self._ensure_unique_entities(entities)
+            return entities
             
         except Exception as e:
-            logger.error(f"Error processing text with MITIE: {e}")
+            logger.error("Error processing text with MITIE: %s", e)
             raise RuntimeError(f"Error in MITIE NER processing: {e}")
     
     def _normalize_mitie_tag(self, tag: str) -> str:
@@ -151,6 +160,21 @@ class MitieNERBackend(NERBackend):
             # Use base class normalization for unknown tags
             return self._normalize_tag(tag)
     
+    def availability_error(self) -> Optional[str]:
+        """
+        Check that MITIE is installed and the model file exists
+        
+        Returns:
+            None if the model can be loaded, otherwise the reason it cannot
+        """
+        if self.is_loaded:
+            return None
+        if importlib.util.find_spec("mitie") is None:
+            return "MITIE not installed. Install with: pip install git+https://github.com/mit-nlp/MITIE.git"
+        if not os.path.exists(self.model_path):
+            return f"MITIE model file not found: {self.model_path}"
+        return None
+    
     def get_backend_info(self) -> Dict[str, Any]:
         """
         Get information about the MITIE backend
@@ -158,7 +182,7 @@ class MitieNERBackend(NERBackend):
         Returns:
             Dictionary with backend information
         """
-        return {
+        info = {
             "backend": "mitie",
             "model_path": self.model_path,
             "is_loaded": self.is_loaded,
@@ -168,6 +192,12 @@ class MitieNERBackend(NERBackend):
             "model_size": "~451MB (Spanish model)",
             "technology": "Built on dlib, uses SVM and word embeddings"
         }
+        
+        error = self.availability_error()
+        info["is_available"] = error is None
+        if error:
+            info["error"] = error
+        return info
     
     def get_supported_entities(self) -> List[str]:
         """
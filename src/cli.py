@@ -1,8 +1,14 @@
 import click
-import json
+import orjson
+import os
 import sys
 from typing import Optional
-from .ner_core import extract_entities, get_backend_info, get_supported_backends, set_backend
+from .ner_core import extract_entities, extract_entities_batch, extract_entities_each, get_backend_info, get_supported_backends, parse_jsonl_text
+from .config import config, configure_logging
+
+# Output for results without entities, same text the formatters would produce
+_EMPTY_JSON = '{\n  "entities": []\n}'
+_NO_ENTITIES = "No entities found."
 
 @click.command()
 @click.argument('text', required=False)
@@ -29,6 +35,7 @@ def main(text: Optional[str], file, output, output_format: str, quiet: bool, bac
         
         ner-cli "Maria studied in Barcelona" --output results.json
     """
+    configure_logging()
     
     # Validate input
     if not text and not file:
@@ -46,7 +53,9 @@ def main(text: Optional[str], file, output, output_format: str, quiet: bool, bac
                 click.echo(f"Error reading file: {e}", err=True)
             sys.exit(1)
     
-    if not text or not text.strip():
+    # Strip once and reuse the result
+    text = text.strip() if text else ""
+    if not text:
         if not quiet:
             click.echo("Error: Text is empty", err=True)
         sys.exit(1)
@@ -61,7 +70,7 @@ def main(text: Optional[str], file, output, output_format: str, quiet: bool, bac
             if not quiet:
                 click.echo(f"Using {backend} backend", err=True)
         
-        entities = extract_entities(text.strip(), backend=backend)
+        entities = extract_entities(text, backend=backend)
         
         if not quiet:
             # Show backend info
@@ -69,13 +78,10 @@ def main(text: Optional[str], file, output, output_format: str, quiet: bool, bac
             click.echo(f"Backend: {backend_info['backend']} ({backend_info.get('model_name', backend_info.get('model_path', 'unknown'))})", err=True)
             click.echo(f"Found {len(entities)} entities", err=True)
         
-        # Format output
-        result = format_output(entities, output_format)
-        
         # Write result
         if output:
             try:
-                output.write(result)
+                write_output(entities, output_format, output)
                 if not quiet:
                     click.echo(f"Results saved to {output.name}", err=True)
             except Exception as e:
@@ -83,88 +89,111 @@ def main(text: Optional[str], file, output, output_format: str, quiet: bool, bac
                     click.echo(f"Error writing file: {e}", err=True)
                 sys.exit(1)
         else:
-            click.echo(result)
+            stdout = click.get_text_stream('stdout')
+            write_output(entities, output_format, stdout)
+            stdout.write("\n")
+            stdout.flush()
             
     except Exception as e:
         if not quiet:
             click.echo(f"Error processing text: {e}", err=True)
         sys.exit(1)
 
-def format_output(entities, format_type: str) -> str:
+def write_output(entities, format_type: str, stream) -> None:
     """
-    Format output according to specified type
+    Write output in the specified format directly to a text stream
+    
+    Avoids building the whole result as one string before writing it.
     
     Args:
         entities: List of found entities
         format_type: Format type (json, table, simple)
-        
-    Returns:
-        Formatted string
+        stream: Text stream to write to
     """
     if format_type == 'json':
-        return json.dumps({"entities": entities}, indent=2, ensure_ascii=False)
+        if not entities:
+            stream.write(_EMPTY_JSON)
+        else:
+            stream.write(orjson.dumps({"entities": entities}, option=orjson.OPT_INDENT_2).decode("utf-8"))
     
     elif format_type == 'table':
         if not entities:
-            return "No entities found."
+            stream.write(_NO_ENTITIES)
+            return
+        
+        # Split into columns once, then calculate column widths
+        tags = [entity['tag'] for entity in entities]
+        labels = [entity['label'] for entity in entities]
+        scores = [entity['score'] for entity in entities]
         
-        # Calculate column widths
-        max_tag = max(len(entity['tag']) for entity in entities)
-        max_label = max(len(entity['label']) for entity in entities)
-        max_score = max(len(entity['score']) for entity in entities)
+        max_tag = max(map(len, tags))
+        max_label = max(map(len, labels))
+        max_score = max(map(len, scores))
         
         # Ensure minimum width for headers
         max_tag = max(max_tag, len('TYPE'))
         max_label = max(max_label, len('ENTITY'))
         max_score = max(max_score, len('SCORE'))
         
+        # Build the row template once and reuse its bound format method
+        row = f"{{:<{max_tag}}} | {{:<{max_label}}} | {{:<{max_score}}}".format
+        
         # Create table
-        header = f"{'TYPE':<{max_tag}} | {'ENTITY':<{max_label}} | {'SCORE':<{max_score}}"
+        header = row('TYPE', 'ENTITY', 'SCORE')
         separator = "-" * len(header)
         
-        lines = [header, separator]
-        
-        for entity in entities:
-            line = f"{entity['tag']:<{max_tag}} | {entity['label']:<{max_label}} | {entity['score']:<{max_score}}"
-            lines.append(line)
+        stream.write(header)
+        stream.write("\n")
+        stream.write(separator)
         
-        return "\n".join(lines)
+        for tag, label, score in zip(tags, labels, scores):
+            stream.write("\n")
+            stream.write(row(tag, label, score))
     
     elif format_type == 'simple':
         if not entities:
-            return "No entities found."
+            stream.write(_NO_ENTITIES)
+            return
         
-        lines = []
+        separator = ""
         for entity in entities:
-            lines.append(f"{entity['label']} ({entity['tag']}) - {entity['score']}")
-        
-        return "\n".join(lines)
+            stream.write(f"{separator}{entity['label']} ({entity['tag']}) - {entity['score']}")
+            separator = "\n"
     
     else:
         raise ValueError(f"Unsupported format: {format_type}")
 
 @click.command()
-@click.option('--host', default='0.0.0.0', help='Server host')
-@click.option('--port', default=8000, help='Server port')
+@click.option('--host', default=config.api_host, help='Server host')
+@click.option('--port', default=config.api_port, help='Server port')
 @click.option('--reload', is_flag=True, help='Auto-reload in development')
 @click.option('--backend', '-b', type=click.Choice(['spacy', 'mitie']), help='NER backend to use (spacy or mitie)')
-def server(host: str, port: int, reload: bool, backend: Optional[str]):
+@click.option('--workers', '-w', default=1, type=click.IntRange(min=1), help='Number of worker processes')
+def server(host: str, port: int, reload: bool, backend: Optional[str], workers: int):
     """
     Start the FastAPI web server
     """
+    configure_logging()
+    
     try:
         import uvicorn
-        from .web_server import app
         
         # Set backend if specified
         if backend:
-            set_backend(backend)
+            # Worker processes are started fresh and read the backend from the environment
+            os.environ["NER_BACKEND"] = backend
+            config.set_backend(backend)
             click.echo(f"Using {backend} backend")
         
         click.echo(f"Starting server at http://{host}:{port}")
-        click.echo("Documentation available at http://localhost:8000/docs")
+        click.echo(f"Documentation available at http://localhost:{port}/docs")
         
-        uvicorn.run(app, host=host, port=port, reload=reload)
+        if workers > 1 or reload:
+            # uvicorn needs an import string to spawn workers or reload
+            uvicorn.run("src.web_server:app", host=host, port=port, reload=reload, workers=workers)
+        else:
+            from .web_server import app
+            uvicorn.run(app, host=host, port=port)
         
     except ImportError:
         click.echo("Error: uvicorn is not installed. Install it with: pip install uvicorn", err=True)
@@ -173,9 +202,85 @@ def server(host: str, port: int, reload: bool, backend: Optional[str]):
         click.echo(f"Error starting server: {e}", err=True)
         sys.exit(1)
 
+@click.command()
+@click.option('--input', '-i', 'input_file', type=click.File('r'), required=True, help='JSONL file with one {"text": ...} object per line')
+@click.option('--output', '-o', type=click.File('w'), default='-', help='JSONL output file (default: stdout)')
+@click.option('--batch-size', default=64, type=click.IntRange(min=1), help='Number of texts analyzed together')
+@click.option('--quiet', '-q', is_flag=True, help='Suppress informational messages')
+@click.option('--backend', '-b', type=click.Choice(['spacy', 'mitie']), help='NER backend to use (spacy or mitie)')
+def batch(input_file, output, batch_size: int, quiet: bool, backend: Optional[str]):
+    """
+    Analyze a JSONL file of texts in batches
+    
+    Writes one JSON object per non-empty input line with its line number
+    and either the entities found or an error message.
+    
+    Example:
+    
+        ner-batch --input texts.jsonl --output entities.jsonl
+    """
+    configure_logging()
+    
+    def flush(pending):
+        texts = [text for _, text, error in pending if error is None]
+        try:
+            results = extract_entities_batch(texts, backend=backend) if texts else []
+            outcomes = iter([(entities, None) for entities in results])
+        except Exception:
+            # Retry one text at a time so only the lines whose text fails get an error
+            outcomes = iter(extract_entities_each(texts, backend=backend))
+        
+        for line_no, _, error in pending:
+            if error is None:
+                entities, text_error = next(outcomes)
+                error = str(text_error) if text_error is not None else None
+            if error:
+                record = {"line": line_no, "error": error}
+            else:
+                record = {"line": line_no, "entities": entities}
+            output.write(orjson.dumps(record).decode("utf-8") + "\n")
+    
+    try:
+        pending = []
+        pending_texts = 0
+        total = 0
+        
+        for line_no, line in enumerate(input_file, start=1):
+            if not line.strip():
+                continue
+            total += 1
+            
+            try:
+                text = parse_jsonl_text(line)
+                error = None if text.strip() else "The 'text' field cannot be empty"
+            except ValueError as e:
+                text, error = None, str(e)
+            
+            pending.append((line_no, text, error))
+            if error is None:
+                pending_texts += 1
+            
+            if pending_texts >= batch_size:
+                flush(pending)
+                pending = []
+                pending_texts = 0
+        
+        if pending:
+            flush(pending)
+        
+        if not quiet:
+            click.echo(f"Processed {total} lines", err=True)
+    
+    except Exception as e:
+        if not quiet:
+            click.echo(f"Error processing batch: {e}", err=True)
+        sys.exit(1)
+
 @click.command()
 def info():
     """Show information about available backends"""
+    configure_logging()
+    
     click.echo("Spanish NER - Available Backends:\n")
     
     supported = get_supported_backends()
@@ -184,7 +289,12 @@ def info():
             backend_info = get_backend_info(backend=backend_name)
             click.echo(f"• {backend_name.upper()}:")
             click.echo(f"  Description: {backend_info['description']}")
-            click.echo(f"  Status: {'✓ Available' if backend_info['is_loaded'] else '✗ Not loaded'}")
+            if not backend_info.get('is_available', True):
+                click.echo(f"  Status: ✗ Not available ({backend_info['error']})")
+            elif backend_info['is_loaded']:
+                click.echo("  Status: ✓ Loaded")
+            else:
+                click.echo("  Status: ✓ Available")
             if 'performance' in backend_info:
                 click.echo(f"  Performance: {backend_info['performance']}")
             if 'model_size' in backend_info:
@@ -196,10 +306,11 @@ def info():
 @click.group()
 def cli():
     """Spanish NER - Named Entity Recognition for Spanish"""
-    pass
+    configure_logging()
 
 cli.add_command(main, name='analyze')
 cli.add_command(server, name='server')
+cli.add_command(batch, name='batch')
 cli.add_command(info, name='info')
 
 if __name__ == '__main__':
@@ -1,6 +1,18 @@
+import logging
 import os
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 
+@lru_cache(maxsize=None)
+def _env(name: str, default: str) -> str:
+    """
+    Read an environment variable once per process
+    
+    Values are memoized, so changes to the environment after the first read
+    are ignored by later Config instances.
+    """
+    return os.getenv(name, default)
+
 class Config:
     """Configuration management for the NER service"""
     
@@ -9,24 +21,39 @@ class Config:
     DEFAULT_SPACY_MODEL = "es_core_news_md"
     DEFAULT_MITIE_MODEL = "MITIE-models/spanish/ner_model.dat"
     
+    # Supported backends, in display order, and a set for membership checks
+    SUPPORTED_BACKENDS = ("spacy", "mitie")
+    _VALID_BACKENDS = frozenset(SUPPORTED_BACKENDS)
+    
     def __init__(self):
         """Initialize configuration from environment variables and defaults"""
         self._config = {
             # Backend selection
-            "ner_backend": os.getenv("NER_BACKEND", self.DEFAULT_BACKEND).lower(),
+            "ner_backend": _env("NER_BACKEND", self.DEFAULT_BACKEND).lower(),
             
             # spaCy configuration
-            "spacy_model": os.getenv("SPACY_MODEL", self.DEFAULT_SPACY_MODEL),
+            "spacy_model": _env("SPACY_MODEL", self.DEFAULT_SPACY_MODEL),
             
             # MITIE configuration
-            "mitie_model_path": os.getenv("MITIE_MODEL_PATH", self.DEFAULT_MITIE_MODEL),
+            "mitie_model_path": _env("MITIE_MODEL_PATH", self.DEFAULT_MITIE_MODEL),
             
             # API configuration
-            "api_host": os.getenv("API_HOST", "0.0.0.0"),
-            "api_port": int(os.getenv("API_PORT", "8000")),
+            "api_host": _env("API_HOST", "0.0.0.0"),
+            "api_port": int(_env("API_PORT", "8000")),
+            
+            # Request batching for the web server
+            "batch_max_size": int(_env("NER_BATCH_MAX_SIZE", "32")),
+            "batch_max_wait_ms": float(_env("NER_BATCH_MAX_WAIT_MS", "10")),
+            "worker_threads": int(_env("NER_WORKER_THREADS", "1")),
+            
+            # Load the model when the web server module is imported (for gunicorn --preload)
+            "preload_model": _env("NER_PRELOAD", "0").lower() in ("1", "true", "yes"),
+            
+            # Number of extraction results kept in memory (0 disables caching)
+            "result_cache_size": int(_env("NER_CACHE_SIZE", "4096")),
             
             # Logging
-            "log_level": os.getenv("LOG_LEVEL", "INFO").upper(),
+            "log_level": _env("LOG_LEVEL", "INFO").upper(),
         }
     
     @property
@@ -54,6 +81,31 @@ class Config:
         """Get the API port"""
         return self._config["api_port"]
     
+    @property
+    def batch_max_size(self) -> int:
+        """Get the maximum number of requests processed in one batch"""
+        return self._config["batch_max_size"]
+    
+    @property
+    def batch_max_wait_ms(self) -> float:
+        """Get how long (ms) to wait for more requests before running a batch"""
+        return self._config["batch_max_wait_ms"]
+    
+    @property
+    def worker_threads(self) -> int:
+        """Get the number of threads running NER inference in the web server"""
+        return self._config["worker_threads"]
+    
+    @property
+    def preload_model(self) -> bool:
+        """Check if the model should be loaded at web server import time"""
+        return self._config["preload_model"]
+    
+    @property
+    def result_cache_size(self) -> int:
+        """Get the maximum number of cached extraction results"""
+        return self._config["result_cache_size"]
+    
     @property
     def log_level(self) -> str:
         """Get the log level"""
@@ -89,7 +141,7 @@ class Config:
         Args:
             backend: Backend name ("spacy" or "mitie")
         """
-        if backend.lower() not in ["spacy", "mitie"]:
+        if backend.lower() not in self._VALID_BACKENDS:
             raise ValueError(f"Invalid backend: {backend}. Must be 'spacy' or 'mitie'")
         
         self._config["ner_backend"] = backend.lower()
@@ -104,7 +156,7 @@ class Config:
         Returns:
             True if valid, False otherwise
         """
-        return backend.lower() in ["spacy", "mitie"]
+        return backend.lower() in self._VALID_BACKENDS
     
     def get_supported_backends(self) -> List[str]:
         """
@@ -113,7 +165,7 @@ class Config:
         Returns:
             List of supported backend names
         """
-        return ["spacy", "mitie"]
+        return list(self.SUPPORTED_BACKENDS)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -125,4 +177,28 @@ class Config:
         return self._config.copy()
 
 # Global configuration instance
-config = Config()
\ No newline at end of file
+config = Config()
+
+# Set once configure_logging has run, so entry points can call it freely
+_logging_configured = False
+
+def configure_logging() -> None:
+    """
+    Configure root logging at LOG_LEVEL
+    
+    Called from each entry point (CLI commands, web server startup) rather
+    than at import time; repeated calls are no-ops. Unknown level names
+    fall back to INFO.
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    
+    level = logging.getLevelName(config.log_level)
+    if not isinstance(level, int):
+        logging.basicConfig(level=logging.INFO)
+        logging.getLogger(__name__).warning("Unknown LOG_LEVEL %r, using INFO", config.log_level)
+        return
+    
+    logging.basicConfig(level=level)
\ No newline at end of file
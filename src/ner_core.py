@@ -1,13 +1,19 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import json
 import logging
+import threading
 from .backends.base import NERBackend
 from .backends.spacy_backend import SpacyNERBackend
 from .backends import get_mitie_backend
 from .config import config
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Short text run through the model at startup
+WARMUP_TEXT = "Juan vive en Madrid y trabaja en Google."
+
 class NERBackendFactory:
     """Factory for creating NER backends"""
     
@@ -43,7 +49,7 @@ class NERBackendFactory:
                 backend_config.update(kwargs)  # Allow override
                 return MitieNERBackend(**backend_config)
             except ImportError as e:
-                logger.error(f"MITIE backend not available: {e}")
+                logger.error("MITIE backend not available: %s", e)
                 raise
         
         else:
@@ -71,7 +77,7 @@ class SpanishNER:
         """
         self.backend_name = backend or config.ner_backend
         self.backend = NERBackendFactory.create_backend(self.backend_name, **kwargs)
-        logger.info(f"Initialized Spanish NER with {self.backend_name} backend")
+        logger.info("Initialized Spanish NER with %s backend", self.backend_name)
     
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """
@@ -86,6 +92,18 @@ class SpanishNER:
         """
         return self.backend.extract_entities(text)
     
+    def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Extract named entities from several texts at once
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            One list of entities per input text, in the same order
+        """
+        return self.backend.extract_entities_batch(texts)
+    
     def get_backend_info(self) -> Dict[str, Any]:
         """
         Get information about the current backend
@@ -104,6 +122,15 @@ class SpanishNER:
         """
         return self.backend.get_supported_entities()
     
+    def load_model(self) -> None:
+        """Load the backend model now instead of on the first extraction"""
+        self.backend.ensure_loaded()
+    
+    def warmup(self) -> None:
+        """Load the model and run it once on a short text so the first request is not slowed down"""
+        self.load_model()
+        self.backend.extract_entities(WARMUP_TEXT)
+    
     @property
     def is_loaded(self) -> bool:
         """Check if the backend is loaded and ready"""
@@ -113,6 +140,39 @@ class SpanishNER:
 _ner_instance = None
 _current_backend = None
 
+# LRU cache of extraction results keyed by (backend, text digest)
+_result_cache: "OrderedDict[Tuple[str, bytes], List[Dict[str, Any]]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+def _cache_key(backend_name: str, text: str) -> Tuple[str, bytes]:
+    """Build a cache key from a 16-byte digest so cached entries don't keep whole texts alive"""
+    return (backend_name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+
+def _cache_get(key: Tuple[str, bytes]) -> Optional[List[Dict[str, Any]]]:
+    """Return a copy of the cached entities for key, or None on a miss"""
+    with _result_cache_lock:
+        entities = _result_cache.get(key)
+        if entities is None:
+            return None
+        _result_cache.move_to_end(key)
+    # Copy so callers can't mutate the cached entities
+    return [dict(entity) for entity in entities]
+
+def _cache_put(key: Tuple[str, bytes], entities: List[Dict[str, Any]]) -> None:
+    """Store a copy of entities for key, evicting the least recently used entries"""
+    if config.result_cache_size <= 0:
+        return
+    with _result_cache_lock:
+        _result_cache[key] = [dict(entity) for entity in entities]
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > config.result_cache_size:
+            _result_cache.popitem(last=False)
+
+def clear_result_cache() -> None:
+    """Drop all cached extraction results"""
+    with _result_cache_lock:
+        _result_cache.clear()
+
 def get_ner_instance(backend: Optional[str] = None, force_reload: bool = False) -> SpanishNER:
     """
     Get the singleton instance of the NER model
@@ -136,9 +196,11 @@ def get_ner_instance(backend: Optional[str] = None, force_reload: bool = False)
         _current_backend != requested_backend or 
         force_reload):
         
-        logger.info(f"Creating new NER instance with {requested_backend} backend")
+        logger.info("Creating new NER instance with %s backend", requested_backend)
         _ner_instance = SpanishNER(backend=requested_backend)
         _current_backend = requested_backend
+        # Results from a previous model must not be served for the new one
+        clear_result_cache()
     
     return _ner_instance
 
@@ -154,7 +216,80 @@ def extract_entities(text: str, backend: Optional[str] = None) -> List[Dict[str,
         List of found entities
     """
     ner = get_ner_instance(backend=backend)
-    return ner.extract_entities(text)
+    key = _cache_key(ner.backend_name, text)
+    
+    entities = _cache_get(key)
+    if entities is None:
+        entities = ner.extract_entities(text)
+        _cache_put(key, entities)
+    
+    return entities
+
+def extract_entities_batch(texts: List[str], backend: Optional[str] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Convenience function to extract entities from several texts in one call
+    
+    Args:
+        texts: Texts to analyze
+        backend: Backend to use. If None, uses current instance or config default.
+        
+    Returns:
+        One list of entities per input text, in the same order
+    """
+    ner = get_ner_instance(backend=backend)
+    keys = [_cache_key(ner.backend_name, text) for text in texts]
+    results = [_cache_get(key) for key in keys]
+    
+    # Only run the model on texts that are not cached
+    misses = [i for i, entities in enumerate(results) if entities is None]
+    if misses:
+        extracted = ner.extract_entities_batch([texts[i] for i in misses])
+        for i, entities in zip(misses, extracted):
+            _cache_put(keys[i], entities)
+            results[i] = entities
+    
+    return results
+
+def extract_entities_each(
+    texts: List[str], backend: Optional[str] = None
+) -> List[Tuple[Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+    """
+    Extract entities from each text separately, capturing errors per text
+    
+    Used to retry a failed batch so only the texts that fail get an error.
+    
+    Args:
+        texts: Texts to analyze
+        backend: Backend to use. If None, uses current instance or config default.
+        
+    Returns:
+        (entities, None) or (None, exception) per input text, in the same order
+    """
+    outcomes = []
+    for text in texts:
+        try:
+            outcomes.append((extract_entities(text, backend=backend), None))
+        except Exception as e:
+            outcomes.append((None, e))
+    return outcomes
+
+def parse_jsonl_text(line: str) -> str:
+    """
+    Get the text to analyze from one line of a JSONL batch input
+    
+    Args:
+        line: JSON object with a "text" field, e.g. {"text": "Juan vive en Madrid"}
+        
+    Returns:
+        The text to analyze
+        
+    Raises:
+        ValueError: If the line is not valid JSON or has no "text" string
+    """
+    record = json.loads(line)
+    if not isinstance(record, dict) or not isinstance(record.get("text"), str):
+        raise ValueError("Each line must be a JSON object with a 'text' string")
+    return record["text"]
 
 def get_backend_info(backend: Optional[str] = None) -> Dict[str, Any]:
     """
@@ -166,8 +301,13 @@ def get_backend_info(backend: Optional[str] = None) -> Dict[str, Any]:
     Returns:
         Dictionary with backend information
     """
-    ner = get_ner_instance(backend=backend)
-    return ner.get_backend_info()
+    requested_backend = backend or config.ner_backend
+    
+    if requested_backend == (_current_backend or config.ner_backend):
+        return get_ner_instance(backend=requested_backend).get_backend_info()
+    
+    # Describe another backend without replacing the active instance and its loaded model
+    return SpanishNER(backend=requested_backend).get_backend_info()
 
 def get_supported_backends() -> List[str]:
     """
@@ -1,18 +1,361 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.datastructures import Headers
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
-from .ner_core import extract_entities, get_backend_info, get_supported_backends
+import orjson
+from .ner_core import extract_entities_batch, extract_entities_each, get_backend_info, get_ner_instance, get_supported_backends, parse_jsonl_text
+from .config import config, configure_logging
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class RequestBatcher:
+    """
+    Collects concurrent NER requests and runs them through the backend together
+    
+    Each request is queued with a future; a background task drains the queue,
+    waiting up to max_wait_ms for more requests (at most max_size), and runs
+    one batched extraction for the whole group. Extraction runs in a thread
+    pool so the event loop keeps serving other requests meanwhile.
+    """
+    
+    def __init__(self, max_size: int = 32, max_wait_ms: float = 10, workers: int = 1):
+        """
+        Initialize the request batcher
+        
+        Args:
+            max_size: Maximum number of texts processed in one batch
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds
+            workers: Number of threads running batches concurrently
+        """
+        self.max_size = max(1, max_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self.workers = max(1, workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._batch_tasks = set()
+        # Requests taken off the queue but not yet handed to a batch task
+        self._collected: List[Tuple[str, asyncio.Future]] = []
+    
+    def start(self) -> None:
+        """Start the background batching task on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ner")
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """
+        Cancel the background batching task and shut down the thread pool
+        
+        Requests that were queued but never dispatched to a batch fail with 503
+        instead of waiting forever.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        pending = self._collected
+        self._collected = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(HTTPException(status_code=503, detail="Server is shutting down"))
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    async def submit(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Queue a text for extraction and wait for its entities
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            List of found entities
+        """
+        if self._task is None:
+            raise HTTPException(status_code=503, detail="Server is shutting down")
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+    
+    async def run_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Run a caller-assembled batch in the thread pool, sharing the worker limit
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            One list of entities per input text, in the same order
+        """
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, extract_entities_batch, texts)
+    
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for one request, then gather more until the batch is full or the wait expires"""
+        items = [await self._queue.get()]
+        self._collected = items
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        
+        while len(items) < self.max_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        return items
+    
+    async def _run(self) -> None:
+        """Background loop that groups queued requests and dispatches batches"""
+        while True:
+            items = await self._collect()
+            # Wait for a free worker; requests arriving meanwhile form the next batch
+            await self._slots.acquire()
+            task = asyncio.create_task(self._process(items))
+            self._collected = []
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _process(self, items: List[Tuple[str, asyncio.Future]]) -> None:
+        """Run one batch in the thread pool and resolve its futures"""
+        texts = [text for text, _ in items]
+        
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                outcomes = [(entities, None) for entities in await loop.run_in_executor(
+                    self._executor, extract_entities_batch, texts
+                )]
+            except Exception as e:
+                logger.error("Error processing NER batch: %s", e)
+                if len(texts) == 1:
+                    outcomes = [(None, e)]
+                else:
+                    # Retry one text at a time so only the requests whose text fails get the error
+                    outcomes = await loop.run_in_executor(self._executor, extract_entities_each, texts)
+        finally:
+            self._slots.release()
+        
+        for (_, future), (entities, error) in zip(items, outcomes):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(entities)
+
+# Number of JSONL lines analyzed together by /v1/batches
+BATCH_LINES = 64
+
+# Maximum number of texts accepted by /ner/batch
+MAX_BATCH_TEXTS = 100
+
+# Maximum number of JSONL lines accepted by /v1/batches, which reads its whole body
+MAX_BATCH_LINES = 1000
+
+batcher = RequestBatcher(
+    max_size=config.batch_max_size,
+    max_wait_ms=config.batch_max_wait_ms,
+    workers=config.worker_threads
+)
+
+# Seconds a cached backend info result is served before it is refreshed
+BACKEND_INFO_TTL = 30
+
+# Backend info per backend name ("" for the default): (timestamp, info)
+_backend_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_backend_info_refreshing = set()
+
+# Strong references to background refresh tasks so they are not garbage collected
+_background_tasks = set()
+
+async def _refresh_backend_info(backend: Optional[str]) -> Dict[str, Any]:
+    """Fetch backend info off the event loop and store it in the cache"""
+    key = backend or ""
+    _backend_info_refreshing.add(key)
+    try:
+        loop = asyncio.get_running_loop()
+        info = await loop.run_in_executor(None, get_backend_info, backend)
+        _backend_info_cache[key] = (loop.time(), info)
+        return info
+    finally:
+        _backend_info_refreshing.discard(key)
+
+async def _refresh_backend_info_quietly(backend: Optional[str]) -> None:
+    """Background refresh that keeps serving the stale value if it fails"""
+    try:
+        await _refresh_backend_info(backend)
+    except Exception as e:
+        logger.error("Error refreshing backend info: %s", e)
+
+async def cached_backend_info(backend: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get backend information, cached for BACKEND_INFO_TTL seconds
+    
+    Once an entry is stale it is still returned while a background task
+    refreshes it (stale-while-revalidate), so health probes never wait.
+    
+    Args:
+        backend: Backend to get info for. If None, uses the default backend.
+        
+    Returns:
+        Dictionary with backend information
+    """
+    key = backend or ""
+    entry = _backend_info_cache.get(key)
+    if entry is None:
+        return await _refresh_backend_info(backend)
+    
+    timestamp, info = entry
+    if asyncio.get_running_loop().time() - timestamp > BACKEND_INFO_TTL and key not in _backend_info_refreshing:
+        task = asyncio.create_task(_refresh_backend_info_quietly(backend))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    return info
+
+# Error raised while warming up the model at startup, reported by /health
+_warmup_error: Optional[str] = None
+
+# With gunicorn --preload the app is imported once in the master process before
+# workers are forked, so loading the model here lets workers share its memory pages
+if config.preload_model:
+    configure_logging()
+    logger.info("Preloading NER model")
+    get_ner_instance().warmup()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load and warm up the model and start the request batcher before serving requests"""
+    global _warmup_error
+    configure_logging()
+    
+    try:
+        logger.info("Warming up NER model")
+        get_ner_instance().warmup()
+        _warmup_error = None
+    except Exception as e:
+        # Keep serving so /health can report the problem
+        logger.error("Error warming up NER model: %s", e)
+        _warmup_error = str(e)
+    
+    batcher.start()
+    yield
+    await batcher.stop()
+
 app = FastAPI(
     title="Spanish NER API",
     description="API for Named Entity Recognition in Spanish",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Maximum length of one text accepted by the API, in characters
+MAX_TEXT_CHARS = 10_000
+
+def _text_error(text: str, subject: str = "The 'text' field") -> Optional[str]:
+    """
+    Validate one text against the API's limits
+    
+    Args:
+        text: Text to validate
+        subject: How the text is named in the error message
+        
+    Returns:
+        None if the text can be analyzed, otherwise the error message
+    """
+    if not text or not text.strip():
+        return f"{subject} cannot be empty"
+    if len(text) > MAX_TEXT_CHARS:
+        return f"{subject} is too long. Maximum {MAX_TEXT_CHARS:,} characters."
+    return None
+
+# Largest JSON body accepted for one text: MAX_TEXT_CHARS characters, allowing
+# for non-ASCII characters sent as \uXXXX escapes, plus the surrounding object
+MAX_TEXT_BODY_BYTES = 6 * MAX_TEXT_CHARS + 4_000
+
+# Request body limits by path, sized to each endpoint's maximum number of texts
+_BODY_LIMITS = {
+    "/ner": MAX_TEXT_BODY_BYTES,
+    "/ner/batch": MAX_TEXT_BODY_BYTES * MAX_BATCH_TEXTS,
+    "/v1/batches": MAX_TEXT_BODY_BYTES * MAX_BATCH_LINES,
+}
+
+_BODY_TOO_LARGE = f"Request body is too large. Maximum {MAX_TEXT_CHARS:,} characters per text."
+
+class BodySizeLimitMiddleware:
+    """
+    ASGI middleware rejecting request bodies above a per-path limit with 413
+    
+    Content-Length is checked up front; chunked bodies are counted as they
+    are received, so oversized bodies are never fully read or parsed.
+    """
+    
+    def __init__(self, app, limits: Dict[str, int]):
+        """
+        Initialize the middleware
+        
+        Args:
+            app: ASGI application to wrap
+            limits: Maximum body size in bytes by request path
+        """
+        self.app = app
+        self.limits = limits
+    
+    async def __call__(self, scope, receive, send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None:
+            try:
+                too_large = int(content_length) > limit
+            except ValueError:
+                response = JSONResponse(status_code=400, content={"detail": "Invalid Content-Length header"})
+                await response(scope, receive, send)
+                return
+            if too_large:
+                response = JSONResponse(status_code=413, content={"detail": _BODY_TOO_LARGE})
+                await response(scope, receive, send)
+                return
+        
+        received = 0
+        
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # FastAPI passes HTTPException through body parsing; other errors become a 400
+                    raise HTTPException(status_code=413, detail=_BODY_TOO_LARGE)
+            return message
+        
+        await self.app(scope, limited_receive, send)
+
+app.add_middleware(BodySizeLimitMiddleware, limits=_BODY_LIMITS)
+
 class NERRequest(BaseModel):
     text: str = Field(..., description="Text to analyze for entity extraction")
     
@@ -23,33 +366,57 @@ class NERRequest(BaseModel):
             }
         }
 
+class NERBatchRequest(BaseModel):
+    texts: List[str] = Field(..., description="Texts to analyze for entity extraction")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "texts": [
+                    "Juan lives in Madrid and works at Google Spain.",
+                    "Maria studied in Barcelona."
+                ]
+            }
+        }
+
 class EntityResponse(BaseModel):
     tag: str = Field(..., description="Entity type (PERSON, LOCATION, ORGANIZATION, MISC, PLACE)")
     score: str = Field(..., description="Model confidence score")
     label: str = Field(..., description="Name of the found entity")
 
 
+# The root response never changes, so serialize it once
+_ROOT_RESPONSE = orjson.dumps({
+    "message": "Spanish NER API",
+    "version": "1.0.0",
+    "description": "API for Named Entity Recognition in Spanish",
+    "endpoints": {
+        "ner": "/ner - POST - Named entity analysis (returns array directly)",
+        "ner_batch": "/ner/batch - POST - Named entity analysis of several texts",
+        "health": "/health - GET - API status with backend info",
+        "batches": "/v1/batches - POST - JSONL batch analysis (returns JSONL)",
+        "backends": "/backends - GET - Available backends info",
+        "docs": "/docs - Interactive documentation"
+    }
+})
+
 @app.get("/", tags=["General"])
 async def root():
     """Root endpoint that returns basic API information"""
-    return {
-        "message": "Spanish NER API",
-        "version": "1.0.0",
-        "description": "API for Named Entity Recognition in Spanish",
-        "endpoints": {
-            "ner": "/ner - POST - Named entity analysis (returns array directly)",
-            "health": "/health - GET - API status with backend info",
-            "backends": "/backends - GET - Available backends info",
-            "docs": "/docs - Interactive documentation"
-        }
-    }
+    return Response(content=_ROOT_RESPONSE, media_type="application/json")
 
 @app.get("/health", tags=["General"])
 async def health_check():
     """Endpoint to check API status"""
     try:
         # Get backend information
-        backend_info = get_backend_info()
+        backend_info = await cached_backend_info()
+        
+        # The model is not loaded and either failed at startup or cannot be loaded
+        if not backend_info.get("is_loaded"):
+            error = _warmup_error or backend_info.get("error")
+            if error is not None:
+                raise RuntimeError(error)
         
         return {
             "status": "healthy",
@@ -58,7 +425,7 @@ async def health_check():
             "message": "API working correctly"
         }
     except Exception as e:
-        logger.error(f"Error in health check: {e}")
+        logger.error("Error in health check: %s", e)
         raise HTTPException(
             status_code=503,
             detail={
@@ -85,47 +452,229 @@ async def analyze_text(request: NERRequest):
     Only entities with score >= 0.5 are returned when using MITIE backend.
     """
     try:
-        if not request.text or not request.text.strip():
+        # Reject empty texts and limit text length to avoid memory issues
+        error = _text_error(request.text)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
+        
+        logger.info("Processing text of %d characters", len(request.text))
+        
+        # Extract entities (batched with other concurrent requests)
+        entities = await batcher.submit(request.text)
+        
+        logger.info("Found %d entities", len(entities))
+        
+        # Backend output already matches EntityResponse; returning a Response skips
+        # response_model validation, which is kept for the OpenAPI schema only
+        return Response(content=orjson.dumps(entities), media_type="application/json")
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error processing NER request: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
+
+@app.post("/ner/batch", response_model=List[List[EntityResponse]], tags=["NER"])
+async def analyze_texts(request: NERBatchRequest):
+    """
+    Analyze several texts in one request
+    
+    - **texts**: Spanish texts to analyze (at most 100, each up to 10,000 characters)
+    
+    Returns one array of unique entities per text, in the same order as the input,
+    with the same fields as /ner. All texts are processed in a single backend batch.
+    """
+    try:
+        if not request.texts:
             raise HTTPException(
                 status_code=400,
-                detail="The 'text' field cannot be empty"
+                detail="The 'texts' field cannot be empty"
             )
         
-        # Limit text length to avoid memory issues
-        if len(request.text) > 10000:
+        if len(request.texts) > MAX_BATCH_TEXTS:
             raise HTTPException(
                 status_code=400,
-                detail="Text is too long. Maximum 10,000 characters."
+                detail=f"Too many texts. Maximum {MAX_BATCH_TEXTS} per request."
             )
         
-        logger.info(f"Processing text of {len(request.text)} characters")
-        
-        # Extract entities
-        entities = extract_entities(request.text)
+        for index, text in enumerate(request.texts):
+            error = _text_error(text, subject=f"Text at index {index}")
+            if error:
+                raise HTTPException(status_code=400, detail=error)
         
-        # Convert to response format
-        entity_responses = [
-            EntityResponse(
-                tag=entity["tag"],
-                score=entity["score"], 
-                label=entity["label"]
-            )
-            for entity in entities
-        ]
+        logger.info("Processing batch of %d texts", len(request.texts))
         
-        logger.info(f"Found {len(entity_responses)} entities")
+        results = await batcher.run_batch(request.texts)
         
-        return entity_responses
+        # Backend output is trusted, so skip response_model validation
+        return Response(content=orjson.dumps(results), media_type="application/json")
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing NER request: {e}")
+        logger.error("Error processing NER batch request: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
 
+async def _run_pending(pending: List[Tuple[int, Optional[str], Optional[str]]]) -> List[bytes]:
+    """
+    Analyze the valid texts of a group of queued JSONL lines in one batch
+    
+    Args:
+        pending: (line number, text, error) per input line; text is None when error is set
+        
+    Returns:
+        One serialized JSONL result per queued line, in input order
+    """
+    texts = [text for _, text, error in pending if error is None]
+    batch_error = None
+    results = []
+    
+    if texts:
+        try:
+            results = await batcher.run_batch(texts)
+        except Exception as e:
+            logger.error("Error processing NER batch: %s", e)
+            batch_error = f"Internal server error: {str(e)}"
+    
+    entities_iter = iter(results)
+    lines = []
+    for line_no, _, error in pending:
+        error = error or batch_error
+        if error:
+            record = {"line": line_no, "error": error}
+        else:
+            record = {"line": line_no, "entities": next(entities_iter)}
+        lines.append(orjson.dumps(record) + b"\n")
+    
+    return lines
+
+def _parse_batch_line(raw: bytes) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validate one JSONL input line
+    
+    Returns:
+        (text, None) for a valid line or (None, error message) otherwise
+    """
+    try:
+        text = parse_jsonl_text(raw.decode("utf-8"))
+    except ValueError as e:
+        return None, str(e)
+    
+    error = _text_error(text)
+    if error:
+        return None, error
+    return text, None
+
+async def _read_batch_lines(request: Request) -> List[Tuple[int, Optional[str], Optional[str]]]:
+    """
+    Read the JSONL request body and validate each non-empty line
+    
+    Lines longer than MAX_TEXT_BODY_BYTES are reported as errors and their
+    content is discarded instead of being buffered. Bodies with more than
+    MAX_BATCH_LINES lines are rejected with 413.
+    
+    Returns:
+        (line number, text, error) per non-empty line; text is None when error is set
+    """
+    entries = []
+    parts = []
+    size = 0
+    too_long = False
+    line_no = 0
+    
+    def finish_line() -> None:
+        nonlocal parts, size, too_long, line_no
+        line_no += 1
+        if line_no > MAX_BATCH_LINES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Too many lines. Maximum {MAX_BATCH_LINES} per request."
+            )
+        if too_long:
+            entries.append((line_no, None, f"Line is too long. Maximum {MAX_TEXT_BODY_BYTES} bytes."))
+        else:
+            raw = b"".join(parts)
+            if raw.strip():
+                text, error = _parse_batch_line(raw)
+                entries.append((line_no, text, error))
+        parts = []
+        size = 0
+        too_long = False
+    
+    async for chunk in request.stream():
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            piece = chunk[start:] if end == -1 else chunk[start:end]
+            if not too_long:
+                size += len(piece)
+                if size > MAX_TEXT_BODY_BYTES:
+                    too_long = True
+                    parts = []
+                else:
+                    parts.append(piece)
+            if end == -1:
+                break
+            finish_line()
+            start = end + 1
+    
+    # Last line without a trailing newline
+    if too_long or size:
+        finish_line()
+    
+    return entries
+
+async def _stream_batch_results(
+    entries: List[Tuple[int, Optional[str], Optional[str]]]
+) -> AsyncIterator[bytes]:
+    """
+    Yield one JSONL result per parsed input line
+    
+    Valid lines are grouped into batches of BATCH_LINES texts so the backend
+    processes them together; results keep the input order.
+    """
+    pending = []
+    pending_texts = 0
+    
+    for entry in entries:
+        pending.append(entry)
+        if entry[2] is None:
+            pending_texts += 1
+        
+        if pending_texts >= BATCH_LINES:
+            for line in await _run_pending(pending):
+                yield line
+            pending = []
+            pending_texts = 0
+    
+    if pending:
+        for line in await _run_pending(pending):
+            yield line
+
+@app.post("/v1/batches", tags=["NER"])
+async def analyze_batch(request: Request):
+    """
+    Analyze many texts in one request
+    
+    The request body is JSONL: one JSON object per line with a **text** field,
+    at most 1000 lines.
+    
+    Returns JSONL (application/x-ndjson), one line per non-empty input line:
+    - **line**: Input line number (1-based)
+    - **entities**: Entities found in that text, same format as /ner
+    - **error**: Present instead of entities when the line could not be analyzed
+    """
+    # Read the whole body before responding: once the response starts, Starlette
+    # listens for disconnects on the same receive channel and the body is lost
+    entries = await _read_batch_lines(request)
+    return StreamingResponse(_stream_batch_results(entries), media_type="application/x-ndjson")
+
 @app.get("/backends", tags=["General"])
 async def get_backends():
     """
@@ -140,7 +689,9 @@ async def get_backends():
         
         for backend_name in supported:
             try:
-                backend_info = get_backend_info(backend=backend_name)
+                backend_info = await cached_backend_info(backend=backend_name)
+                if not backend_info.get("is_available", True):
+                    backend_info = {**backend_info, "status": "unavailable"}
                 backends_info[backend_name] = backend_info
             except Exception as e:
                 backends_info[backend_name] = {
@@ -153,11 +704,11 @@ async def get_backends():
         return {
             "supported_backends": supported,
             "backends": backends_info,
-            "default_backend": get_backend_info()["backend"]
+            "default_backend": (await cached_backend_info())["backend"]
         }
         
     except Exception as e:
-        logger.error(f"Error getting backends info: {e}")
+        logger.error("Error getting backends info: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Error retrieving backends information: {str(e)}"
@@ -165,4 +716,4 @@ async def get_backends():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    uvicorn.run(app, host=config.api_host, port=config.api_port)
\ No newline at end of file
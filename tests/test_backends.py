@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from src.backends import spacy_backend
+from src.backends.mitie_backend import MitieNERBackend
+from src.backends.spacy_backend import SpacyNERBackend
+
+def test_spacy_missing_model_is_unavailable(monkeypatch):
+    monkeypatch.setattr(spacy_backend.spacy.util, "is_package", lambda name: False)
+    info = SpacyNERBackend(model_name="missing_model").get_backend_info()
+    
+    assert info["is_loaded"] is False
+    assert info["is_available"] is False
+    assert "missing_model" in info["error"]
+
+def test_spacy_installed_model_is_available(monkeypatch):
+    monkeypatch.setattr(spacy_backend.spacy.util, "is_package", lambda name: name == "es_core_news_md")
+    info = SpacyNERBackend().get_backend_info()
+    
+    assert info["is_available"] is True
+    assert "error" not in info
+
+def test_mitie_missing_model_file_is_unavailable(tmp_path):
+    info = MitieNERBackend(model_path=str(tmp_path / "ner_model.dat")).get_backend_info()
+    
+    assert info["is_loaded"] is False
+    assert info["is_available"] is False
+    assert info["error"]
+
+def test_normalize_tag():
+    backend = SpacyNERBackend()
+    
+    assert backend._normalize_tag("B-PER") == "PERSON"
+    assert backend._normalize_tag("loc") == "LOCATION"
+    assert backend._normalize_tag("unknown") == "MISC"
+
+def test_spacy_entities_are_deduplicated():
+    doc = SimpleNamespace(ents=[
+        SimpleNamespace(label_="PER", text="Juan "),
+        SimpleNamespace(label_="PER", text="juan"),
+        SimpleNamespace(label_="LOC", text="Juan"),
+        SimpleNamespace(label_="MISC", text="Euro"),
+        SimpleNamespace(label_="MISC", text="EURO"),
+    ])
+    entities = list(SpacyNERBackend()._stream_entities(doc))
+    
+    assert entities == [
+        {"tag": "PERSON", "score": "0.95", "label": "Juan"},
+        {"tag": "LOCATION", "score": "0.95", "label": "Juan"},
+        {"tag": "MISC", "score": "0.95", "label": "Euro"},
+    ]
+
+def test_mitie_empty_text_does_not_load_model(tmp_path):
+    backend = MitieNERBackend(model_path=str(tmp_path / "ner_model.dat"))
+    
+    assert backend.extract_entities("   ") == []
+    assert backend.is_loaded is False
\ No newline at end of file
@@ -0,0 +1,50 @@
+import io
+
+import orjson
+from click.testing import CliRunner
+
+from src import cli, ner_core
+
+ENTITIES = [
+    {"tag": "PERSON", "score": "0.95", "label": "José"},
+    {"tag": "LOCATION", "score": "0.95", "label": "Madrid"},
+]
+
+def render(entities, format_type):
+    stream = io.StringIO()
+    cli.write_output(entities, format_type, stream)
+    return stream.getvalue()
+
+def test_write_output_json():
+    assert orjson.loads(render(ENTITIES, "json")) == {"entities": ENTITIES}
+    assert orjson.loads(render([], "json")) == {"entities": []}
+
+def test_write_output_table_and_simple():
+    table = render(ENTITIES, "table")
+    simple = render(ENTITIES, "simple")
+    
+    assert "José" in table and "LOCATION" in table
+    assert "José" in simple and "Madrid" in simple
+    assert render([], "simple") == "No entities found."
+
+
+def test_batch_isolates_failing_line(monkeypatch):
+    def failing_batch(texts, backend=None):
+        raise ValueError("bad batch")
+    
+    def extract_one(text, backend=None):
+        if text == "bad":
+            raise ValueError("bad text")
+        return [{"tag": "PERSON", "score": "0.95", "label": text}]
+    
+    monkeypatch.setattr(cli, "extract_entities_batch", failing_batch)
+    monkeypatch.setattr(ner_core, "extract_entities", extract_one)
+    body = '{"text": "Juan"}\n{"text": "bad"}\nnot json\n{"text": "Ana"}\n'
+    result = CliRunner().invoke(cli.batch, ["--input", "-", "--quiet"], input=body)
+    
+    assert result.exit_code == 0
+    records = [orjson.loads(line) for line in result.output.splitlines()]
+    assert records[0] == {"line": 1, "entities": [{"tag": "PERSON", "score": "0.95", "label": "Juan"}]}
+    assert records[1] == {"line": 2, "error": "bad text"}
+    assert "error" in records[2]
+    assert records[3]["entities"][0]["label"] == "Ana"
\ No newline at end of file
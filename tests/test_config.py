@@ -0,0 +1,31 @@
+import logging
+
+import pytest
+
+from src import config as config_module
+
+@pytest.fixture
+def basic_config_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(config_module.logging, "basicConfig", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(config_module, "_logging_configured", False)
+    return calls
+
+def test_configure_logging_uses_log_level(monkeypatch, basic_config_calls):
+    monkeypatch.setitem(config_module.config._config, "log_level", "WARNING")
+    config_module.configure_logging()
+    
+    assert basic_config_calls == [{"level": logging.WARNING}]
+
+def test_configure_logging_falls_back_to_info(monkeypatch, basic_config_calls):
+    monkeypatch.setitem(config_module.config._config, "log_level", "VERBOSE")
+    config_module.configure_logging()
+    
+    assert basic_config_calls == [{"level": logging.INFO}]
+
+
+def test_configure_logging_runs_once(basic_config_calls):
+    config_module.configure_logging()
+    config_module.configure_logging()
+    
+    assert len(basic_config_calls) == 1
\ No newline at end of file
@@ -0,0 +1,246 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import src.web_server as web_server
+from src import ner_core
+
+def fake_extract_batch(texts):
+    """Return one PERSON entity per text, labelled with the text itself"""
+    return [[{"tag": "PERSON", "score": "0.95", "label": text}] for text in texts]
+
+def fake_backend_info(backend=None):
+    return {"backend": backend or "spacy", "is_loaded": True}
+
+class FakeNER:
+    def warmup(self):
+        pass
+
+class BrokenNER:
+    def warmup(self):
+        raise RuntimeError("model not found")
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(web_server, "extract_entities_batch", fake_extract_batch)
+    monkeypatch.setattr(web_server, "get_backend_info", fake_backend_info)
+    monkeypatch.setattr(web_server, "get_ner_instance", lambda: FakeNER())
+    monkeypatch.setattr(web_server, "_backend_info_cache", {})
+    with TestClient(web_server.app) as test_client:
+        yield test_client
+
+def parse_jsonl(body):
+    return [web_server.orjson.loads(line) for line in body.splitlines()]
+
+def test_health(client):
+    response = client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+def test_health_reports_warmup_error(monkeypatch):
+    monkeypatch.setattr(web_server, "get_backend_info", lambda backend=None: {"backend": "spacy", "is_loaded": False})
+    monkeypatch.setattr(web_server, "get_ner_instance", lambda: BrokenNER())
+    monkeypatch.setattr(web_server, "_backend_info_cache", {})
+    monkeypatch.setattr(web_server, "_warmup_error", None)
+    
+    with TestClient(web_server.app) as test_client:
+        response = test_client.get("/health")
+    
+    assert response.status_code == 503
+    assert response.json()["detail"]["status"] == "unhealthy"
+    assert response.json()["detail"]["error"] == "model not found"
+
+def test_backends_reports_unavailable(client, monkeypatch):
+    def backend_info(backend=None):
+        if backend == "mitie":
+            return {"backend": "mitie", "is_loaded": False, "is_available": False, "error": "MITIE not installed"}
+        return fake_backend_info(backend)
+    
+    monkeypatch.setattr(web_server, "get_backend_info", backend_info)
+    backends = client.get("/backends").json()["backends"]
+    
+    assert backends["mitie"]["status"] == "unavailable"
+    assert backends["mitie"]["error"] == "MITIE not installed"
+    assert "status" not in backends["spacy"]
+
+def test_ner(client):
+    response = client.post("/ner", json={"text": "Juan"})
+    
+    assert response.status_code == 200
+    assert response.json() == [{"tag": "PERSON", "score": "0.95", "label": "Juan"}]
+
+def test_ner_documents_entity_schema(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    schema = paths["/ner"]["post"]["responses"]["200"]["content"]["application/json"]["schema"]
+    
+    assert schema["items"]["$ref"] == "#/components/schemas/EntityResponse"
+
+def test_ner_rejects_large_body(client):
+    body = b'{"text": "' + b"a" * web_server.MAX_TEXT_BODY_BYTES + b'"}'
+    
+    assert client.post("/ner", content=body).status_code == 413
+
+def test_ner_rejects_large_chunked_body(client):
+    body = b'{"text": "' + b"a" * web_server.MAX_TEXT_BODY_BYTES + b'"}'
+    chunks = [body[i:i + 4096] for i in range(0, len(body), 4096)]
+    response = client.post("/ner", content=iter(chunks))
+    
+    assert response.status_code == 413
+
+def test_v1_batches_rejects_large_body(client, monkeypatch):
+    monkeypatch.setitem(web_server._BODY_LIMITS, "/v1/batches", 1000)
+    body = b'{"text": "Juan"}\n' * 100
+    
+    assert client.post("/v1/batches", content=body).status_code == 413
+
+def test_v1_batches_rejects_large_chunked_body(client, monkeypatch):
+    monkeypatch.setitem(web_server._BODY_LIMITS, "/v1/batches", 1000)
+    chunks = [b'{"text": "Juan"}\n' * 10] * 10
+    
+    assert client.post("/v1/batches", content=iter(chunks)).status_code == 413
+
+def test_ner_batch(client):
+    response = client.post("/ner/batch", json={"texts": ["Juan", "Madrid"]})
+    
+    assert response.status_code == 200
+    assert [entities[0]["label"] for entities in response.json()] == ["Juan", "Madrid"]
+
+def test_v1_batches(client):
+    body = b'{"text": "Juan"}\n\n{"text": ""}\nnot json\n{"text": "Madrid"}'
+    response = client.post("/v1/batches", content=body)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = parse_jsonl(response.text)
+    assert [record["line"] for record in records] == [1, 3, 4, 5]
+    assert records[0]["entities"][0]["label"] == "Juan"
+    assert "error" in records[1]
+    assert "error" in records[2]
+    assert records[3]["entities"][0]["label"] == "Madrid"
+
+def test_v1_batches_chunked_lines(client):
+    # Lines split across body chunks are reassembled
+    chunks = [b'{"te', b'xt": "Juan"}\n{"text": "Ma', b'drid"}\n']
+    response = client.post("/v1/batches", content=iter(chunks))
+    
+    labels = [record["entities"][0]["label"] for record in parse_jsonl(response.text)]
+    assert labels == ["Juan", "Madrid"]
+
+def test_v1_batches_line_too_long(client):
+    long_line = b'{"text": "' + b"a" * web_server.MAX_TEXT_BODY_BYTES + b'"}'
+    chunks = [long_line[:1000], long_line[1000:], b'\n{"text": "Juan"}\n']
+    response = client.post("/v1/batches", content=iter(chunks))
+    
+    records = parse_jsonl(response.text)
+    assert records[0]["line"] == 1
+    assert "too long" in records[0]["error"]
+    assert records[1] == {"line": 2, "entities": [{"tag": "PERSON", "score": "0.95", "label": "Juan"}]}
+
+def test_v1_batches_rejects_too_many_lines(client):
+    body = b'{"text": "Juan"}\n' * (web_server.MAX_BATCH_LINES + 1)
+    response = client.post("/v1/batches", content=body)
+    
+    assert response.status_code == 413
+
+def test_v1_batches_accepts_max_lines(client):
+    body = b'{"text": "Juan"}\n' * web_server.MAX_BATCH_LINES
+    response = client.post("/v1/batches", content=body)
+    
+    assert len(parse_jsonl(response.text)) == web_server.MAX_BATCH_LINES
+
+def test_v1_batches_groups_lines(client, monkeypatch):
+    batch_sizes = []
+    
+    def recording_batch(texts):
+        batch_sizes.append(len(texts))
+        return fake_extract_batch(texts)
+    
+    monkeypatch.setattr(web_server, "extract_entities_batch", recording_batch)
+    lines = [b'{"text": "t%d"}' % i for i in range(web_server.BATCH_LINES + 1)]
+    response = client.post("/v1/batches", content=b"\n".join(lines))
+    
+    assert len(parse_jsonl(response.text)) == web_server.BATCH_LINES + 1
+    assert batch_sizes == [web_server.BATCH_LINES, 1]
+
+def test_batcher_groups_concurrent_requests(monkeypatch):
+    batch_sizes = []
+    
+    def recording_batch(texts):
+        batch_sizes.append(len(texts))
+        return fake_extract_batch(texts)
+    
+    monkeypatch.setattr(web_server, "extract_entities_batch", recording_batch)
+    
+    async def run():
+        batcher = web_server.RequestBatcher(max_size=8, max_wait_ms=50, workers=1)
+        batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(f"t{i}") for i in range(3)))
+        finally:
+            await batcher.stop()
+    
+    results = asyncio.run(run())
+    
+    assert [entities[0]["label"] for entities in results] == ["t0", "t1", "t2"]
+    assert batch_sizes == [3]
+
+def test_batcher_isolates_failing_text(monkeypatch):
+    def failing_batch(texts):
+        raise ValueError("bad batch")
+    
+    def extract_one(text, backend=None):
+        if text == "bad":
+            raise ValueError("bad text")
+        return fake_extract_batch([text])[0]
+    
+    monkeypatch.setattr(web_server, "extract_entities_batch", failing_batch)
+    monkeypatch.setattr(ner_core, "extract_entities", extract_one)
+    
+    async def run():
+        batcher = web_server.RequestBatcher(max_size=8, max_wait_ms=50, workers=1)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(text) for text in ["good", "bad", "fine"]),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+    
+    good, bad, fine = asyncio.run(run())
+    
+    assert good[0]["label"] == "good"
+    assert isinstance(bad, ValueError) and str(bad) == "bad text"
+    assert fine[0]["label"] == "fine"
+
+def test_ner_validates_text(client):
+    empty = client.post("/ner", json={"text": "  "})
+    too_long = client.post("/ner", json={"text": "a" * (web_server.MAX_TEXT_CHARS + 1)})
+    
+    assert empty.status_code == 400
+    assert too_long.status_code == 400
+    assert "10,000" in too_long.json()["detail"]
+
+def test_ner_batch_reports_invalid_index(client):
+    response = client.post("/ner/batch", json={"texts": ["Juan", ""]})
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Text at index 1 cannot be empty"
+
+def test_batcher_stop_fails_pending_requests():
+    async def run():
+        batcher = web_server.RequestBatcher(max_size=1, max_wait_ms=0, workers=1)
+        batcher.start()
+        # Keep the only worker slot busy so requests are never dispatched
+        await batcher._slots.acquire()
+        collected = asyncio.ensure_future(batcher.submit("a"))
+        queued = asyncio.ensure_future(batcher.submit("b"))
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        return await asyncio.wait_for(asyncio.gather(collected, queued, return_exceptions=True), 5)
+    
+    for result in asyncio.run(run()):
+        assert isinstance(result, web_server.HTTPException)
+        assert result.status_code == 503
\ No newline at end of file